@@ -0,0 +1,41 @@
+import pandas_datareader as web
+import pandas as pd
+
+import glob
+import os
+import tempfile
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def load_ohlcv(ticker, start, end):
+    # same-day reruns read from disk instead of hitting yahoo again
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{ticker}_{start:%Y%m%d}_{end:%Y%m%d}.pkl")
+    if os.path.exists(path):
+        return pd.read_pickle(path)
+    df = web.DataReader(ticker, "yahoo", start, end)[OHLCV].copy()
+    _write_atomic(df, path)
+    _prune(ticker, start, path)
+    return df
+
+
+def _write_atomic(df, path):
+    # an interrupted run must not leave a truncated pickle behind
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_pickle(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _prune(ticker, start, keep):
+    # each new day writes a fresh full history; older ones are superseded
+    prefix = glob.escape(os.path.join(CACHE_DIR, f"{ticker}_{start:%Y%m%d}_"))
+    for old in glob.glob(prefix + "*.pkl"):
+        if old != keep:
+            os.remove(old)